@@ -1,5 +1,8 @@
 import zipfile
 import io
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import pandas as pd
 import re
 from datetime import datetime
@@ -8,6 +11,7 @@ import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import numpy as np
+import python_calamine
 
 # Page configuration
 st.set_page_config(
@@ -17,45 +21,37 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Header keywords for the date and hours columns
+DATE_RE = re.compile(r'date|day|datum|fecha', re.IGNORECASE)
+HOURS_RE = re.compile(r'hour|time|work|duration|hrs|horas', re.IGNORECASE)
+
 def detect_headers(df):
     """
     Dynamically detect Date and Hours columns in the dataframe
     Returns: (header_row, date_col, hours_col)
     """
-    date_col, hours_col, header_row = None, None, None
-    
     # Search through first 10 rows for headers
-    for r in range(min(10, len(df))):
-        row_has_date = False
-        row_has_hours = False
-        temp_date_col = None
-        temp_hours_col = None
-        
-        for c in range(len(df.columns)):
-            if r >= len(df) or c >= len(df.columns):
-                continue
-                
-            cell_val = str(df.iloc[r, c]).lower().strip()
-            
-            # Look for date-related headers
-            if any(keyword in cell_val for keyword in ['date', 'day', 'datum', 'fecha']):
-                temp_date_col = c
-                row_has_date = True
-            
-            # Look for hours-related headers
-            if any(keyword in cell_val for keyword in ['hour', 'time', 'work', 'duration', 'hrs', 'horas']):
-                temp_hours_col = c
-                row_has_hours = True
-        
-        # If we found both in the same row, that's our header row
-        if row_has_date and row_has_hours:
-            header_row = r
-            date_col = temp_date_col
-            hours_col = temp_hours_col
-            break
+    # (the patterns ignore case, so cells are matched without lowercasing them first)
+    head = df.head(10).astype(str)
+    date_mask = head.apply(lambda s: s.str.contains(DATE_RE, na=False)).to_numpy(dtype=bool)
+    hours_mask = head.apply(lambda s: s.str.contains(HOURS_RE, na=False)).to_numpy(dtype=bool)
+    
+    # The first row with both a date and an hours header is our header row
+    header_rows = np.flatnonzero(date_mask.any(axis=1) & hours_mask.any(axis=1))
+    if len(header_rows) == 0:
+        return None, None, None
+    
+    # Within that row, the last matching column wins
+    header_row = int(header_rows[0])
+    date_col = int(np.flatnonzero(date_mask[header_row])[-1])
+    hours_col = int(np.flatnonzero(hours_mask[header_row])[-1])
     
     return header_row, date_col, hours_col
 
+# A name made only of letters (unicode-aware, so accented names survive)
+NAME_RE = re.compile(r'[^\W\d_]+')
+
+@lru_cache(maxsize=1024)
 def extract_developer_name(filename):
     """
     Extract developer name from filename - takes first word before * or first word before _timesheet
@@ -65,60 +61,84 @@ def extract_developer_name(filename):
     - john_doe_timesheet.xlsx -> John (first word only)
     - mary*smith*timesheet.xlsx -> Mary
     """
-    # Remove file extension and path
-    base_name = filename.split('/')[-1]  # Remove path if present
-    base_name = base_name.replace('.xlsx', '').replace('.xls', '')
+    # Remove path and file extension
+    base_name = filename.rsplit('/', 1)[-1]
+    if base_name.endswith('.xlsx'):
+        base_name = base_name[:-5]
+    elif base_name.endswith('.xls'):
+        base_name = base_name[:-4]
     
     # First, check if there's an asterisk - if so, take everything before the first *
     if '*' in base_name:
-        name = base_name.split('*')[0]
-        return name.strip().title()
+        return base_name.split('*', 1)[0].strip().title()
     
-    # If no asterisk, always take just the first word (before first underscore)
-    # This handles cases like prashanth_reddy_timesheet -> prashanth
-    first_words = base_name.split('_')[0].strip()
-    first_word = first_words.split(' ')[0].strip()
-    # Clean up the first word
-    if first_word and first_word.isalpha():
+    # If no asterisk, always take just the first word (before first underscore or space)
+    first_word = base_name.split('_', 1)[0].strip().split(' ', 1)[0]
+    if NAME_RE.fullmatch(first_word):
         return first_word.title()
     
     # Fallback for edge cases
     return "Unknown"
 
-def clean_and_parse_date(date_val):
+# Cheap check for strings that look like ISO-8601 dates
+ISO_DATE_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2}')
+
+def to_ns_datetimes(parsed):
     """
-    Try to parse various date formats
+    Convert parsed (UTC) dates to naive datetime64[ns], treating anything outside
+    the range datetime64[ns] can hold as unparsed
     """
-    if pd.isna(date_val):
-        return None
-    
-    date_str = str(date_val).strip()
+    parsed = parsed.dt.tz_localize(None)
+    parsed = parsed.where(parsed.between(pd.Timestamp.min, pd.Timestamp.max))
+    return parsed.dt.as_unit('ns')
+
+def clean_and_parse_date(date_data):
+    """
+    Parse a whole column of dates, trying various date formats
+    """
+    date_strs = date_data.astype(str).str.strip()
+    present = date_data.notna()
     
-    # Common date formats to try
-    date_formats = [
-        '%Y-%m-%d',
-        '%m/%d/%Y',
-        '%d/%m/%Y',
-        '%m-%d-%Y',
-        '%d-%m-%Y',
-        '%Y/%m/%d',
-        '%B %d, %Y',
-        '%b %d, %Y',
-        '%d %B %Y',
-        '%d %b %Y',
-    ]
+    # ISO dates (including stringified Excel datetimes) go through pandas'
+    # ISO-8601 parser in one vectorized pass; utc=True lets cells with and
+    # without offsets share a column (naive ones are left as they are)
+    iso_mask = present & date_strs.str.match(ISO_DATE_PATTERN)
+    parsed = pd.Series(pd.NaT, index=date_data.index, dtype='datetime64[ns]')
+    if iso_mask.any():
+        parsed.loc[iso_mask] = to_ns_datetimes(
+            pd.to_datetime(date_strs[iso_mask], format='ISO8601', utc=True, errors='coerce')
+        )
     
-    for fmt in date_formats:
-        try:
-            return pd.to_datetime(date_str, format=fmt)
-        except:
-            continue
+    # Everything else goes through pandas' mixed-format parser, month-first
+    # (MM/DD/YYYY) and then day-first for whatever that couldn't read
+    for dayfirst in (False, True):
+        mask = parsed.isna() & present
+        if not mask.any():
+            break
+        # (yearless cells like 'January' come back as year 1 and end up unparsed)
+        parsed.loc[mask] = to_ns_datetimes(pd.to_datetime(
+            date_strs[mask], format='mixed', dayfirst=dayfirst, utc=True, errors='coerce'
+        ))
     
-    # Try pandas' flexible parsing
+    return parsed
+
+def read_sheet_rows(file_bytes):
+    """
+    Read the first sheet as a list of rows, using calamine directly and
+    falling back to openpyxl for anything calamine can't open
+    """
     try:
-        return pd.to_datetime(date_str, errors='coerce')
-    except:
-        return None
+        workbook = python_calamine.CalamineWorkbook.from_filelike(io.BytesIO(file_bytes))
+        return workbook.get_sheet_by_index(0).to_python(skip_empty_area=False)
+    except Exception as calamine_error:
+        try:
+            df = pd.read_excel(io.BytesIO(file_bytes), header=None, engine='openpyxl')
+        except Exception as openpyxl_error:
+            # Report both readers' errors; calamine's is usually the relevant one
+            raise ValueError(
+                f"calamine: {calamine_error}; openpyxl: {openpyxl_error}"
+            ) from calamine_error
+        return df.to_numpy(dtype=object).tolist()
 
 def extract_data_from_xlsx(file_bytes, file_name):
     """
@@ -126,85 +146,99 @@ def extract_data_from_xlsx(file_bytes, file_name):
     """
     try:
         # Read the Excel file
-        df = pd.read_excel(io.BytesIO(file_bytes), header=None, engine='openpyxl')
+        rows = read_sheet_rows(file_bytes)
         
-        if df.empty:
+        if not rows:
             return None, f"Empty file: {file_name}"
         
         # Detect headers
-        header_row, date_col, hours_col = detect_headers(df)
+        header_row, date_col, hours_col = detect_headers(pd.DataFrame(rows[:10]))
         
         if header_row is None or date_col is None or hours_col is None:
             return None, f"Could not detect date/hours columns in: {file_name}"
         
         # Extract data starting from row after header
-        data_start_row = header_row + 1
-        if data_start_row >= len(df):
+        data_rows = rows[header_row + 1:]
+        if not data_rows:
             return None, f"No data rows found after header in: {file_name}"
         
-        # Get the data columns
-        date_data = df.iloc[data_start_row:, date_col]
-        hours_data = df.iloc[data_start_row:, hours_col]
-        
-        # Create dataframe
+        # Create dataframe from just the date and hours columns
         data = pd.DataFrame({
-            'Date': date_data,
-            'Hours': hours_data
-        })
+            'Date': [row[date_col] for row in data_rows],
+            'Hours': [row[hours_col] for row in data_rows]
+        }, dtype=object)
         
         # Clean and parse dates
-        data['Date'] = data['Date'].apply(clean_and_parse_date)
+        data['Date'] = clean_and_parse_date(data['Date'])
         
-        # Clean and parse hours
-        data['Hours'] = pd.to_numeric(data['Hours'], errors='coerce')
+        # Clean and parse hours (kept as float64 so entries like 46.05 sum exactly)
+        data['Hours'] = pd.to_numeric(data['Hours'], errors='coerce').astype('float64')
         
-        # Remove rows where date or hours are invalid
-        data = data.dropna(subset=['Date', 'Hours'])
-        data = data[data['Hours'] > 0]  # Remove zero or negative hours
+        # Remove rows where date or hours are invalid, or hours are zero or negative
+        # (NaN hours compare False, so missing hours drop out of the same mask)
+        mask = data['Date'].notna() & (data['Hours'] > 0)
+        data = data.loc[mask].reset_index(drop=True)
         
         if data.empty:
             return None, f"No valid date/hours data found in: {file_name}"
         
         # Extract developer name
         dev_name = extract_developer_name(file_name)
-        data['Developer'] = dev_name
+        data['Developer'] = pd.Categorical([dev_name] * len(data), categories=[dev_name])
         
-        # Add month/year for aggregation
-        data['YearMonth'] = data['Date'].dt.to_period('M')
-        data['Year'] = data['Date'].dt.year
-        data['Month'] = data['Date'].dt.month
-        data['MonthName'] = data['Date'].dt.month_name()
+        # Add a single integer month key (year * 12 + zero-based month) for aggregation;
+        # display labels are derived from it only where they're shown
+        # (datetime64[ns] only spans years 1677-2262, so the key always fits in int16)
+        data['YM'] = (data['Date'].dt.year.values * 12 + data['Date'].dt.month.values - 1).astype('int16')
         
         return data, None
         
     except Exception as e:
         return None, f"Error processing {file_name}: {str(e)}"
 
+# macOS metadata and hidden files that should never be parsed
+SKIPPED_PREFIXES = ('__MACOSX/', '.')
+EXCEL_EXTENSIONS = ('.xlsx', '.xls')
+
+def has_excel_extension(filename):
+    """
+    Check if the file name ends with xlsx or xls, in any case
+    """
+    # Only the tail needs lowercasing; this also rules out directories
+    return filename[-5:].lower().endswith(EXCEL_EXTENSIONS)
+
 def is_valid_excel_file(filename):
     """
     Check if the file is a valid Excel file (not macOS metadata)
     """
-    # Skip macOS metadata files
-    if filename.startswith('__MACOSX/') or '._' in filename:
-        return False
-    
-    # Skip hidden files and directories
-    if filename.startswith('.') or '/.DS_Store' in filename:
-        return False
-    
     # Must end with xlsx or xls
-    if not filename.lower().endswith(('.xlsx', '.xls')):
+    if not has_excel_extension(filename):
         return False
     
-    # Skip directories
-    if filename.endswith('/'):
-        return False
+    # Skip macOS metadata and hidden files
+    return not (
+        filename.startswith(SKIPPED_PREFIXES)
+        or '._' in filename
+        or '/.DS_Store' in filename
+    )
+
+def extract_zip_member(zip_file, file_name):
+    """
+    Read one XLSX member out of the ZIP and extract its timesheet data
+    """
+    try:
+        file_bytes = zip_file.read(file_name)
+    except Exception as e:
+        return None, f"Could not read {file_name}: {str(e)}"
     
-    return True
+    return extract_data_from_xlsx(file_bytes, file_name)
 
-def process_zip_file(uploaded_file):
+# st.cache_data is shared by every session on the server, so keep it bounded
+@st.cache_data(show_spinner=False, max_entries=8, ttl='1h')
+def _process_zip_bytes(zip_bytes):
     """
-    Process ZIP file containing XLSX timesheets
+    Process ZIP file contents containing XLSX timesheets
+    Cached on the ZIP bytes, so reruns with the same upload skip all Excel parsing
     """
     all_data = []
     error_messages = []
@@ -212,65 +246,169 @@ def process_zip_file(uploaded_file):
     skipped_files = []
     
     try:
-        with zipfile.ZipFile(uploaded_file) as zip_file:
+        with zipfile.ZipFile(io.BytesIO(zip_bytes)) as zip_file:
             # Filter for valid Excel files only
             all_files = zip_file.namelist()
             xlsx_files = [f for f in all_files if is_valid_excel_file(f)]
             
             # Track skipped files for user info
-            skipped_files = [f for f in all_files if f.endswith(('.xlsx', '.xls')) and not is_valid_excel_file(f)]
+            skipped_files = [f for f in all_files if has_excel_extension(f) and not is_valid_excel_file(f)]
             
             if not xlsx_files:
                 return pd.DataFrame(), ["No valid XLSX files found in ZIP"], [], skipped_files
             
-            progress_bar = st.progress(0)
-            status_text = st.empty()
-            
-            for i, file_name in enumerate(xlsx_files):
-                status_text.text(f"Processing: {file_name}")
-                
-                try:
-                    with zip_file.open(file_name) as xlsx_file:
-                        file_bytes = xlsx_file.read()
-                        data, error = extract_data_from_xlsx(file_bytes, file_name)
-                        
-                        if data is not None:
-                            all_data.append(data)
-                            processed_files.append(file_name)
-                        else:
-                            error_messages.append(error)
-                            
-                except Exception as e:
-                    error_messages.append(f"Could not read {file_name}: {str(e)}")
+            # Each worker reads its own member (ZipFile serializes reads of the
+            # underlying file), so only the workbooks being parsed sit in memory
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                results = executor.map(
+                    lambda file_name: extract_zip_member(zip_file, file_name),
+                    xlsx_files
+                )
                 
-                progress_bar.progress((i + 1) / len(xlsx_files))
-            
-            progress_bar.empty()
-            status_text.empty()
+                for file_name, (data, error) in zip(xlsx_files, results):
+                    if data is not None:
+                        all_data.append(data)
+                        processed_files.append(file_name)
+                    else:
+                        error_messages.append(error)
             
     except Exception as e:
         return pd.DataFrame(), [f"Error reading ZIP file: {str(e)}"], [], []
     
     if all_data:
         combined_df = pd.concat(all_data, ignore_index=True)
+        # Each file has its own single-category Developer column; unify them
+        combined_df['Developer'] = combined_df['Developer'].astype('category')
         return combined_df, error_messages, processed_files, skipped_files
     else:
         return pd.DataFrame(), error_messages, processed_files, skipped_files
 
+def process_zip_file(uploaded_file):
+    """
+    Process uploaded ZIP file containing XLSX timesheets
+    """
+    # Streamlit elements can't be created inside the cached function, so any
+    # progress feedback lives out here
+    status_text = st.empty()
+    status_text.text(f"Processing: {uploaded_file.name}")
+    
+    result = _process_zip_bytes(uploaded_file.getvalue())
+    
+    status_text.empty()
+    return result
+
+# English month names indexed by zero-based month
+MONTH_NAMES = np.array(pd.date_range('2000-01-01', periods=12, freq='MS').month_name(), dtype=object)
+
+@st.cache_data(show_spinner=False, max_entries=32, ttl='1h')
 def create_monthly_summary(df):
     """
     Create monthly summary of hours worked
     """
-    summary = df.groupby(['Developer', 'Year', 'Month', 'MonthName', 'YearMonth']).agg({
-        'Hours': 'sum',
-        'Date': 'count'  # Number of working days
-    }).reset_index()
+    summary = df.groupby(['Developer', 'YM'], sort=False, observed=True).agg(
+        Hours=('Hours', 'sum'),
+        WorkingDays=('Date', 'count')  # Number of working days
+    ).reset_index()
+    
+    # The summary is small, so plain strings keep filtered pivots and charts from
+    # listing every developer category
+    summary['Developer'] = summary['Developer'].astype(str)
+    
+    # Everything else about the month follows from the YM key
+    summary['Year'] = (summary['YM'] // 12).astype('int16')
+    summary['Month'] = (summary['YM'] % 12 + 1).astype('int8')
+    year_str = summary['Year'].astype(str)
+    summary['YearMonthStr'] = year_str + '-' + summary['Month'].astype(str).str.zfill(2)
+    month_names = pd.Series(MONTH_NAMES[summary['Month'].to_numpy() - 1], index=summary.index, dtype=str)
+    summary['MonthYear'] = month_names + ' ' + year_str
+    
+    return summary.sort_values(['YM', 'Developer'])
+
+def filter_timesheet(df, monthly_summary, selected_developers, date_range=None):
+    """
+    Filter timesheet rows and the monthly summary by developer and an optional
+    inclusive (start_date, end_date) range
+    Returns: (filtered_df, filtered_summary)
+    """
+    developer_rows = df['Developer'].isin(selected_developers)
+    developer_months = monthly_summary['Developer'].isin(selected_developers)
+    if date_range is None:
+        return df[developer_rows], monthly_summary[developer_months]
+    
+    # Whole days are selected, so rows run up to midnight after the end date
+    range_start = pd.Timestamp(date_range[0]).normalize()
+    range_stop = pd.Timestamp(date_range[1]).normalize() + pd.Timedelta(days=1)
+    filtered_df = df[developer_rows & (df['Date'] >= range_start) & (df['Date'] < range_stop)]
+    
+    # The full summary only matches those rows when both bounds fall on month
+    # boundaries (or outside the data); otherwise regroup so partial edge
+    # months only count the selected days
+    whole_months = (
+        (range_start.day == 1 or range_start <= df['Date'].min()) and
+        (range_stop.day == 1 or range_stop > df['Date'].max())
+    )
+    if not whole_months:
+        return filtered_df, create_monthly_summary(filtered_df)
+    
+    last_day = range_stop - pd.Timedelta(days=1)
+    start_ym = range_start.year * 12 + range_start.month - 1
+    end_ym = last_day.year * 12 + last_day.month - 1
+    filtered_summary = monthly_summary[
+        developer_months & monthly_summary['YM'].between(start_ym, end_ym)
+    ]
+    return filtered_df, filtered_summary
+
+def summary_for_export(summary):
+    """
+    Lay the monthly summary out with the CSV download's columns, dropping the
+    internal YM key and restoring the month name and YYYY-MM month columns
+    """
+    return pd.DataFrame({
+        'Developer': summary['Developer'],
+        'Year': summary['Year'],
+        'Month': summary['Month'],
+        'MonthName': MONTH_NAMES[summary['Month'].to_numpy() - 1],
+        'YearMonth': summary['YearMonthStr'],
+        'Hours': summary['Hours'],
+        'WorkingDays': summary['WorkingDays'],
+        'YearMonthStr': summary['YearMonthStr'],
+        'MonthYear': summary['MonthYear']
+    })
+
+@st.cache_data(show_spinner=False, max_entries=32, ttl='1h')
+def pivot_by_month(summary, label_col):
+    """
+    Pivot summary hours into a Developer x month table, with months in
+    calendar order and labelled by label_col
+    """
+    pivot = summary.set_index(['Developer', 'YM'])['Hours'].unstack('YM', fill_value=0)
+    labels = summary.drop_duplicates('YM').set_index('YM')[label_col]
+    pivot = pivot.rename(columns=labels)
+    pivot.columns.name = label_col
+    return pivot
+
+@st.cache_data(show_spinner=False, max_entries=32, ttl='1h')
+def pivot_with_monthly_totals(summary):
+    """
+    Developer x month hours table with a TOTAL HOURS row, plus the monthly totals
+    """
+    pivot_summary = pivot_by_month(summary, 'MonthYear')
+    
+    # Calculate monthly totals for each column
+    monthly_totals = pivot_summary.sum()
     
-    summary.rename(columns={'Date': 'WorkingDays'}, inplace=True)
-    summary['YearMonthStr'] = summary['YearMonth'].dt.strftime('%Y-%m')
-    summary['MonthYear'] = summary['MonthName'] + ' ' + summary['Year'].astype(str)
+    # Add totals row to pivot table
+    pivot_with_totals = pivot_summary.copy()
+    pivot_with_totals.loc['TOTAL HOURS'] = monthly_totals
     
-    return summary.sort_values(['Year', 'Month', 'Developer'])
+    return pivot_with_totals, monthly_totals
+
+@st.cache_data(show_spinner=False, max_entries=32, ttl='1h')
+def to_csv_bytes(df):
+    """
+    Serialize a dataframe to CSV bytes for the download buttons
+    """
+    return df.to_csv(index=False).encode('utf-8')
 
 def main():
     st.title("📊 Developer Timesheet Analyzer")
@@ -337,16 +475,12 @@ def main():
             )
             
             # Apply filters
-            if len(date_range) == 2:
-                filtered_df = df[
-                    (df['Developer'].isin(selected_developers)) &
-                    (df['Date'] >= pd.Timestamp(date_range[0])) &
-                    (df['Date'] <= pd.Timestamp(date_range[1]))
-                ]
-                filtered_summary = create_monthly_summary(filtered_df)
-            else:
-                filtered_df = df[df['Developer'].isin(selected_developers)]
-                filtered_summary = monthly_summary[monthly_summary['Developer'].isin(selected_developers)]
+            filtered_df, filtered_summary = filter_timesheet(
+                df,
+                monthly_summary,
+                selected_developers,
+                date_range if len(date_range) == 2 else None
+            )
             
             # Main content
             if not filtered_df.empty:
@@ -366,7 +500,7 @@ def main():
                     st.metric("Active Developers", active_developers)
                 
                 with col4:
-                    months_covered = filtered_summary['YearMonth'].nunique()
+                    months_covered = filtered_summary['YM'].nunique()
                     st.metric("Months Covered", months_covered)
                 
                 # Tabs for different views
@@ -376,19 +510,7 @@ def main():
                     st.subheader("Monthly Hours Summary")
                     
                     # Pivot table for better display
-                    pivot_summary = filtered_summary.pivot_table(
-                        index='Developer',
-                        columns='MonthYear',
-                        values='Hours',
-                        fill_value=0
-                    )
-                    
-                    # Calculate monthly totals for each column
-                    monthly_totals = pivot_summary.sum()
-                    
-                    # Add totals row to pivot table
-                    pivot_with_totals = pivot_summary.copy()
-                    pivot_with_totals.loc['TOTAL HOURS'] = monthly_totals
+                    pivot_with_totals, monthly_totals = pivot_with_monthly_totals(filtered_summary)
                     
                     st.dataframe(
                         pivot_with_totals,
@@ -457,7 +579,7 @@ def main():
                     st.plotly_chart(fig_totals, use_container_width=True)
                     
                     # Download button for summary
-                    csv = filtered_summary.to_csv(index=False)
+                    csv = to_csv_bytes(summary_for_export(filtered_summary))
                     st.download_button(
                         label="📥 Download Monthly Summary as CSV",
                         data=csv,
@@ -481,27 +603,27 @@ def main():
                     fig_bar.update_layout(xaxis_tickangle=-45, height=500)
                     st.plotly_chart(fig_bar, use_container_width=True)
                     
-                    # Line chart showing trends
-                    fig_line = px.line(
-                        filtered_summary,
-                        x='YearMonthStr',
-                        y='Hours',
-                        color='Developer',
+                    # Line chart showing trends (WebGL traces stay responsive on long ranges)
+                    fig_line = go.Figure()
+                    for dev, dev_summary in filtered_summary.groupby('Developer', sort=False):
+                        fig_line.add_trace(go.Scattergl(
+                            x=dev_summary['YearMonthStr'],
+                            y=dev_summary['Hours'],
+                            mode='lines+markers',
+                            name=dev
+                        ))
+                    fig_line.update_layout(
                         title="Monthly Hours Trend",
-                        labels={'Hours': 'Hours Worked', 'YearMonthStr': 'Month'},
-                        markers=True
+                        xaxis_title='Month',
+                        yaxis_title='Hours Worked',
+                        legend_title_text='Developer',
+                        height=500
                     )
-                    fig_line.update_layout(height=500)
                     st.plotly_chart(fig_line, use_container_width=True)
                     
                     # Heatmap
                     if len(developers) > 1 and len(filtered_summary['YearMonthStr'].unique()) > 1:
-                        heatmap_data = filtered_summary.pivot_table(
-                            index='Developer',
-                            columns='YearMonthStr',
-                            values='Hours',
-                            fill_value=0
-                        )
+                        heatmap_data = pivot_by_month(filtered_summary, 'YearMonthStr')
                         
                         fig_heatmap = px.imshow(
                             heatmap_data,
@@ -538,7 +660,9 @@ def main():
                     st.subheader("Raw Timesheet Data")
                     
                     # Show individual daily entries
-                    raw_display = filtered_df[['Developer', 'Date', 'Hours', 'MonthName', 'Year']].sort_values('Date', ascending=False)
+                    raw_display = filtered_df[['Developer', 'Date', 'Hours']].sort_values('Date', ascending=False)
+                    raw_display['MonthName'] = raw_display['Date'].dt.month_name()
+                    raw_display['Year'] = raw_display['Date'].dt.year
                     
                     st.dataframe(
                         raw_display,
@@ -556,7 +680,7 @@ def main():
                     )
                     
                     # Download raw data
-                    raw_csv = raw_display.to_csv(index=False)
+                    raw_csv = to_csv_bytes(raw_display)
                     st.download_button(
                         label="📥 Download Raw Data as CSV",
                         data=raw_csv,
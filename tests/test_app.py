@@ -0,0 +1,146 @@
+import datetime
+import io
+
+import openpyxl
+import pandas as pd
+
+import app
+
+
+def test_clean_and_parse_date_drops_yearless_cells():
+    # Month-only separator rows parse to year 1 and must not break the column
+    dates = pd.Series(['2024-01-05', 'January', 'Sept', 'Dec', '1st Jan', '03/15/2024'], dtype=object)
+    parsed = app.clean_and_parse_date(dates)
+
+    assert parsed.tolist()[0] == pd.Timestamp('2024-01-05')
+    assert parsed.iloc[1:5].isna().all()
+    assert parsed.iloc[5] == pd.Timestamp('2024-03-15')
+
+
+def test_clean_and_parse_date_rejects_out_of_range_iso_dates():
+    # These used to wrap around silently when cast to datetime64[ns]
+    dates = pd.Series(['0224-01-15', '3024-01-15', '2024-01-15'], dtype=object)
+    parsed = app.clean_and_parse_date(dates)
+
+    assert parsed.iloc[:2].isna().all()
+    assert parsed.iloc[2] == pd.Timestamp('2024-01-15')
+
+
+def test_clean_and_parse_date_mixes_naive_and_offset_iso_dates():
+    dates = pd.Series(['2024-01-15', '2024-01-15 09:00:00', '2024-01-15T10:00:00+02:00'], dtype=object)
+    parsed = app.clean_and_parse_date(dates)
+
+    assert str(parsed.dtype) == 'datetime64[ns]'
+    assert parsed.tolist() == [
+        pd.Timestamp('2024-01-15'),
+        pd.Timestamp('2024-01-15 09:00'),
+        pd.Timestamp('2024-01-15 08:00'),
+    ]
+
+
+def test_extract_developer_name():
+    assert app.extract_developer_name('prashanth*_reddy_timesheet.xlsx') == 'Prashanth'
+    assert app.extract_developer_name('timesheets/john_doe_timesheet.xlsx') == 'John'
+    assert app.extract_developer_name('José García.xls') == 'José'
+    # Everything before the first * is kept, not just the first word
+    assert app.extract_developer_name('mary smith*x.xlsx') == 'Mary Smith'
+    assert app.extract_developer_name('john_doe*x.xlsx') == 'John_Doe'
+    # Names that aren't purely letters don't collapse into fragments
+    assert app.extract_developer_name("o'brien_timesheet.xlsx") == 'Unknown'
+    assert app.extract_developer_name('j0hn_timesheet.xlsx') == 'Unknown'
+    assert app.extract_developer_name('anne-marie_timesheet.xlsx') == 'Unknown'
+
+
+def test_metadata_members_are_skipped_in_any_case():
+    for name in ['__MACOSX/._A.XLSX', 'dir/._timesheet.xlsx', '.hidden.XLS']:
+        assert app.has_excel_extension(name)
+        assert not app.is_valid_excel_file(name)
+    assert app.is_valid_excel_file('team/John_timesheet.XLSX')
+    assert not app.has_excel_extension('team/')
+
+
+def test_create_monthly_summary_handles_no_rows():
+    empty = pd.DataFrame({
+        'Date': pd.Series(dtype='datetime64[ns]'),
+        'Hours': pd.Series(dtype='float64'),
+        'Developer': pd.Categorical([]),
+        'YM': pd.Series(dtype='int16'),
+    })
+    summary = app.create_monthly_summary(empty)
+
+    assert summary.empty
+    assert 'MonthYear' in summary.columns
+
+
+def test_hours_keep_their_entered_values():
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.append(['Date', 'Hours'])
+    entries = [('2024-01-08', 46.05), ('2024-01-15', 46.2), ('2024-01-22', 46.7), ('2024-01-29', 46.7)]
+    for date, hours in entries:
+        sheet.append([date, hours])
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+
+    data, error = app.extract_data_from_xlsx(buffer.getvalue(), 'John_timesheet.xlsx')
+    assert error is None
+    assert data['Hours'].tolist() == [hours for _, hours in entries]
+
+    # float32 turned 46.05 into 46.049999 and this month into 185.650009, which
+    # tipped one-decimal totals the wrong way; float64 stays on the entered total
+    summary = app.create_monthly_summary(data)
+    assert abs(summary['Hours'].iloc[0] - 185.65) < 1e-9
+    assert abs(data['Hours'].sum() - 185.65) < 1e-9
+
+
+def make_timesheet(entries):
+    # Rows shaped like the combined output of _process_zip_bytes
+    df = pd.DataFrame(entries, columns=['Developer', 'Date', 'Hours'])
+    df['Date'] = pd.to_datetime(df['Date'], format='ISO8601').dt.as_unit('ns')
+    df['Hours'] = df['Hours'].astype('float64')
+    df['Developer'] = df['Developer'].astype('category')
+    df['YM'] = (df['Date'].dt.year * 12 + df['Date'].dt.month - 1).astype('int16')
+    return df
+
+
+def test_filter_timesheet_summary_matches_filtered_rows():
+    entries = [
+        (dev, f'2024-03-{day} 09:00', 8.0)
+        for dev in ['John', 'Mary'] for day in range(25, 32)
+    ] + [
+        ('John', '2024-01-10', 7.5),
+        ('John', '2024-01-20', 6.0),
+        ('Mary', '2024-02-29 17:30', 4.0),
+    ]
+    df = make_timesheet(entries)
+    monthly_summary = app.create_monthly_summary(df)
+
+    ranges = [
+        (datetime.date(2024, 1, 10), datetime.date(2024, 3, 31)),  # default view
+        (datetime.date(2024, 1, 1), datetime.date(2024, 2, 29)),   # whole months
+        (datetime.date(2024, 1, 15), datetime.date(2024, 3, 27)),  # cuts through months
+        (datetime.date(2024, 2, 1), datetime.date(2024, 2, 28)),   # stops a day short
+    ]
+    for date_range in ranges:
+        for developers in (['John', 'Mary'], ['Mary']):
+            filtered_df, filtered_summary = app.filter_timesheet(
+                df, monthly_summary, developers, date_range
+            )
+            assert filtered_summary['Hours'].sum() == filtered_df['Hours'].sum()
+            assert filtered_summary['WorkingDays'].sum() == len(filtered_df)
+            assert set(filtered_summary['Developer']) <= set(developers)
+
+    # The end date is inclusive even when entries carry a time of day
+    filtered_df, _ = app.filter_timesheet(
+        df, monthly_summary, ['John', 'Mary'], ranges[0]
+    )
+    assert filtered_df['Hours'].sum() == 14 * 8.0 + 7.5 + 6.0 + 4.0
+
+
+def test_filter_timesheet_without_date_range():
+    df = make_timesheet([('John', '2024-01-10', 7.5), ('Mary', '2024-01-11', 6.0)])
+    monthly_summary = app.create_monthly_summary(df)
+
+    filtered_df, filtered_summary = app.filter_timesheet(df, monthly_summary, ['Mary'])
+    assert filtered_df['Developer'].tolist() == ['Mary']
+    assert filtered_summary['Developer'].tolist() == ['Mary']